@@ -0,0 +1,108 @@
+def build_app():
+    """
+    Builds the Typer app on demand, so importing this module stays cheap.
+    Heavy imports (rich, planner, executor) are deferred into the commands.
+    """
+    import typer
+
+    app = typer.Typer(help="Local-first file organizer.", add_completion=False)
+
+    @app.callback()
+    def _root() -> None:
+        pass
+
+    @app.command()
+    def version() -> None:
+        """Show the installed version."""
+        from sortodoco import __version__
+        typer.echo(f"sortodoco {__version__}")
+
+    @app.command()
+    def plan(
+        folder: str = typer.Argument(..., help="Folder to organize, e.g. ~/Downloads."),
+        rules: str | None = typer.Option(
+            None, "--rules",
+            help="Path to extensions.json. Defaults to rules/extensions.json of a source checkout.",
+        ),
+        dry: bool = typer.Option(False, "--dry", help="Only show the plan, do not move files."),
+        no_rules: bool = typer.Option(False, "--no-rules", help="With --dry: skip loading rules."),
+        sort_ops: bool = typer.Option(False, "--sorted", help="Order operations by file name."),
+        output: str = typer.Option("table", "--format", help="Output format: table or json."),
+    ) -> None:
+        """Plan (and optionally apply) sorting of a folder."""
+        if output not in ("table", "json"):
+            typer.echo(f"Unknown format: {output} (expected table or json)", err=True)
+            raise typer.Exit(code=2)
+        if no_rules and not dry:
+            typer.echo("--no-rules is only allowed together with --dry", err=True)
+            raise typer.Exit(code=2)
+
+        from sortodoco.cli.paths import resolve_folder, resolve_rules_path
+
+        folder_path = resolve_folder(folder)
+        if not folder_path.is_dir():
+            typer.echo(f"Folder not found: {folder_path}", err=True)
+            raise typer.Exit(code=1)
+        rules_path = None
+        if not no_rules:
+            rules_path = resolve_rules_path(rules)
+            if rules_path is None:
+                typer.echo(
+                    f"Rules file not found: {rules}" if rules
+                    else "No bundled rules (installed build?), pass --rules PATH",
+                    err=True,
+                )
+                raise typer.Exit(code=1)
+
+        from sortodoco.services.planner import plan_downloads
+
+        plan_result = plan_downloads(folder_path, rules_path, sort_ops=sort_ops)
+
+        if output == "json":
+            # Plain json keeps rich out of the import path entirely
+            import json
+            import sys
+
+            report = None
+            if not dry:
+                from sortodoco.services.executor import apply_plan
+                report = apply_plan(plan_result)
+
+            # Streamed op by op: no list of per-op dicts for large plans.
+            # One compact encoder is reused, json.dumps would build a new one per call.
+            encode = json.JSONEncoder(separators=(",", ":")).encode
+            out = sys.stdout
+            out.write('{"session":%s,"summary":%s,"ops":[' % (
+                encode(plan_result.session_ts), encode(plan_result.summary)
+            ))
+            for i, op in enumerate(plan_result.ops):
+                if i:
+                    out.write(",")
+                out.write(encode({"kind": op.kind, "src": str(op.src), "dst": str(op.dst)}))
+            out.write("]")
+            if report is not None:
+                out.write(',"report":%s' % encode(report))
+            out.write("}\n")
+            return
+
+        from rich.console import Console
+        from rich.table import Table
+
+        table = Table(title=f"Session {plan_result.session_ts}")
+        table.add_column("Category")
+        table.add_column("Files", justify="right")
+        for category, count in plan_result.summary.items():
+            table.add_row(category, str(count))
+        console = Console()
+        console.print(table)
+
+        if dry:
+            return
+
+        from sortodoco.services.executor import apply_plan
+        report = apply_plan(plan_result)
+        console.print(f"Moved: {report['moved']}  Skipped: {report['skipped']}  Errors: {len(report['errors'])}")
+        for src, reason in report["errors"]:
+            console.print(f"  {src}: {reason}")
+
+    return app
@@ -1,2 +1,35 @@
-def main():
-    print("SortoDoco CLI is alive!")
\ No newline at end of file
+import sys
+
+USAGE = """Usage: sortodoco COMMAND [OPTIONS]
+
+Local-first file organizer.
+
+Commands:
+  version  Show the installed version.
+  plan     Plan (and optionally apply) sorting of a folder.
+
+Run `sortodoco plan --help` for the options of a command.
+"""
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Cheap dispatcher in front of the Typer app.
+    `version` and `--help` are answered here so they never pay the
+    typer/click/rich import cost; every other command builds the full app.
+    """
+    args = sys.argv[1:] if argv is None else list(argv)
+
+    if not args or args[0] in ("-h", "--help"):
+        print(USAGE, end="")
+        return
+    if args[0] == "version":
+        from sortodoco import __version__
+        print(f"sortodoco {__version__}")
+        return
+
+    from sortodoco.cli.app import build_app
+    build_app()(args=args, prog_name="sortodoco")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+# rules/ lives at the repository root and is not packaged into the wheel, so this
+# only resolves in a source checkout; installed builds must pass --rules.
+BUNDLED_RULES = Path(__file__).resolve().parents[3] / "rules" / "extensions.json"
+
+# absolute path (after expanduser) -> result; relative paths depend on the cwd
+_folder_cache: dict[str, Path] = {}
+_rules_path_cache: Path | None = None
+
+def resolve_folder(folder: str | None) -> Path:
+    """
+    Expands "~" and returns an absolute path; defaults to ~/Downloads.
+    resolve() is only paid for relative paths or symlinks; absolute inputs are memoized.
+    """
+    p = Path(folder).expanduser() if folder else Path.home() / "Downloads"
+    if not p.is_absolute():
+        return p.resolve()
+
+    key = str(p)
+    cached = _folder_cache.get(key)
+    if cached is not None:
+        return cached
+
+    if p.is_symlink():
+        p = p.resolve()
+
+    _folder_cache[key] = p
+    return p
+
+def resolve_rules_path(rules: str | None = None) -> Path | None:
+    """
+    Explicit path wins; otherwise the bundled rules/extensions.json
+    (source checkouts only, see BUNDLED_RULES).
+    The default lookup is cached until the cached file disappears.
+    Returns None if no rules file exists.
+    """
+    global _rules_path_cache
+
+    if rules:
+        p = Path(rules).expanduser()
+        return p if p.is_file() else None
+
+    if _rules_path_cache is None or not _rules_path_cache.exists():
+        _rules_path_cache = BUNDLED_RULES if BUNDLED_RULES.is_file() else None
+    return _rules_path_cache
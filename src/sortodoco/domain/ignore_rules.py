@@ -1,5 +1,9 @@
 from enum import Enum, auto
 from dataclasses import dataclass, field
+import fnmatch
+import re
+
+GLOB_CHARS = "*?["
 
 class SkipReason(Enum):
     SUFFIX = auto()
@@ -7,9 +11,33 @@ class SkipReason(Enum):
     GLOB = auto()
     HIDDEN_ATTR = auto()
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IgnoreRules:
-    suffixes: tuple[str, ...] = field(default_factory=tuple)
-    names: tuple[str, ...] = field(default_factory=tuple)
-    globs: tuple[str, ...] = field(default_factory=tuple)
-    hidden: bool = True # whether hidden attributes should be taken into account
\ No newline at end of file
+    """
+    All entries are casefolded (*_cf), matching is done on name.casefold().
+    Container types follow how each field is tested:
+    - suffixes_cf: tuple, for the C fast path of str.endswith(tuple)
+    - names_cf: frozenset, tested with `in`
+    - globs_cf: tuple, order kept; compiled into _glob_literals/_glob_re
+    """
+    suffixes_cf: tuple[str, ...] = ()
+    names_cf: frozenset[str] = frozenset()
+    globs_cf: tuple[str, ...] = ()
+    hidden: bool = True # whether hidden attributes should be taken into account
+
+    # Derived from globs: entries without wildcards are plain set lookups,
+    # real patterns are compiled once into a single alternation regex.
+    _glob_literals: frozenset[str] = field(init=False, repr=False, compare=False)
+    _glob_re: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        literals = frozenset(g for g in self.globs_cf if not any(c in g for c in GLOB_CHARS))
+        pattern = "|".join(f"(?:{fnmatch.translate(g)})" for g in self.globs_cf if g not in literals)
+        object.__setattr__(self, "_glob_literals", literals)
+        object.__setattr__(self, "_glob_re", re.compile(pattern) if pattern else None)
+
+    def matches_glob(self, name_cf: str) -> bool:
+        """True if the casefolded name matches any entry of globs_cf."""
+        return name_cf in self._glob_literals or (
+            self._glob_re is not None and self._glob_re.match(name_cf) is not None
+        )
@@ -1,16 +1,17 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Literal, NamedTuple
 
 OpKind = Literal["move"] # TODO: Add "trash" later
 
-@dataclass(frozen=True)
-class Operation:
+class Operation(NamedTuple):
+    # NamedTuple over frozen dataclass: no frozen __setattr__ guard, compact tuple storage.
+    # Note: compares equal to a plain tuple with the same fields.
     kind: OpKind
     src: Path
     dst: Path
 
-@dataclass
+@dataclass(slots=True)
 class Plan:
     session_ts: str
     ops: list[Operation]
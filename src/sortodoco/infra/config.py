@@ -1,24 +1,86 @@
 from pathlib import Path
+from typing import Iterable
 import json
+import os
+import sys
 from sortodoco.domain.ignore_rules import IgnoreRules
 
+try:
+    import orjson
+except ImportError: # optional speedup, stdlib json is the fallback
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+# str(path) -> (st_mtime_ns, st_size, rules, ext_map)
+_rules_cache: dict[str, tuple[int, int, dict[str, list[str]], dict[str, str]]] = {}
+
+# stdlib json.loads(bytes) raises UnicodeDecodeError on non-UTF-8 input
+_JSON_ERRORS: tuple[type[Exception], ...] = (json.JSONDecodeError, UnicodeDecodeError)
+if orjson is not None:
+    _JSON_ERRORS += (orjson.JSONDecodeError,)
+
 BUILTIN_IGNORE = IgnoreRules(
-    suffixes=(".crdownload", ".part", ".tmp", ".download"),
-    names=("desktop.ini", ".ds_store", "thumbs.db"),
-    globs=("~$*", ".~lock.*#"),
+    suffixes_cf=(".crdownload", ".part", ".tmp", ".download"),
+    names_cf=frozenset({"desktop.ini", ".ds_store", "thumbs.db"}),
+    globs_cf=("~$*", ".~lock.*#"),
     hidden=True,
 )
 
 def load_ignore_rules(config_path: Path | None) -> IgnoreRules:
-    user = IgnoreRules()
+    """
+    Merges user rules from a JSON file on top of BUILTIN_IGNORE:
+    {"suffixes": [...], "names": [...], "globs": [...], "hidden": true}
+    A missing, unreadable or malformed file falls back to the builtin rules.
+    """
+    user = IgnoreRules(hidden=BUILTIN_IGNORE.hidden)
+
+    if config_path is not None and config_path.is_file():
+        try:
+            with open(config_path, "rb") as file:
+                data = _json_loads(file.read())
+            hidden = data.get("hidden", BUILTIN_IGNORE.hidden)
+            if not isinstance(hidden, bool):
+                raise TypeError("'hidden' must be true or false")
+            user = _normalize_rules(
+                suffixes=_str_list(data, "suffixes"),
+                names=_str_list(data, "names"),
+                globs=_str_list(data, "globs"),
+                hidden=hidden,
+            )
+        except _JSON_ERRORS + (OSError, TypeError, AttributeError):
+            pass
+
+    return _normalize_rules(
+        suffixes=BUILTIN_IGNORE.suffixes_cf + user.suffixes_cf,
+        names=BUILTIN_IGNORE.names_cf | user.names_cf,
+        globs=BUILTIN_IGNORE.globs_cf + user.globs_cf,
+        hidden=user.hidden,
+    )
 
-def _normalize_rules(r:IgnoreRules) -> IgnoreRules:
-    pass
+def _str_list(data: dict, key: str) -> list[str]:
+    """data[key] as a list of strings (missing -> []); anything else is a TypeError."""
+    value = data.get(key, [])
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise TypeError(f"'{key}' must be a list of strings")
+    return value
+
+def _normalize_rules(suffixes: Iterable[str],
+                     names: Iterable[str],
+                     globs: Iterable[str],
+                     hidden: bool) -> IgnoreRules:
+    """Casefolds every entry and drops duplicates (first occurrence wins)."""
+    return IgnoreRules(
+        suffixes_cf=tuple(dict.fromkeys(s.casefold() for s in suffixes)),
+        names_cf=frozenset(n.casefold() for n in names),
+        globs_cf=tuple(dict.fromkeys(g.casefold() for g in globs)),
+        hidden=hidden,
+    )
 
 def load_rules(json_path: Path) -> dict[str, list[str]]:
 
-    with open(json_path, "r") as file:
-        extensions = json.load(file)
+    # Binary read skips the text-decoding layer; orjson parses bytes directly
+    with open(json_path, "rb") as file:
+        extensions = _json_loads(file.read())
 
     cleaned_extensions: dict[str, list[str]] = {}
     for category, ext_list in extensions.items():
@@ -32,11 +94,33 @@ def build_ext_map(rules: dict[str, list[str]]) -> dict[str, str]:
     ext_map: dict[str, str] = {}
 
     for category, ext_list in rules.items():
+        # Interned keys/values: lookups in the planner's scan loop can
+        # short-circuit on identity, and every value shares one string
+        category = sys.intern(category)
         for ext in ext_list:
-            if ext in ext_map and ext_map[ext] != category:
+            ext = sys.intern(ext)
+            prev = ext_map.get(ext)
+            if prev is not None and prev != category:
                 raise ValueError(
-                    f"Extension '{ext}' already mapped to '{ext_map[ext]}', also found in '{category}'."
+                    f"Extension '{ext}' already mapped to '{prev}', also found in '{category}'."
                 )
             ext_map[ext] = category
         
-    return ext_map
\ No newline at end of file
+    return ext_map
+
+def load_rules_cached(json_path: Path) -> tuple[dict[str, list[str]], dict[str, str]]:
+    """
+    Returns (rules, ext_map) for json_path, re-parsing only when the file's
+    mtime or size changed since the last call. Callers must not mutate the result.
+    """
+    st = os.stat(json_path)
+    key = str(json_path)
+
+    cached = _rules_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], cached[3]
+
+    rules = load_rules(json_path)
+    ext_map = build_ext_map(rules)
+    _rules_cache[key] = (st.st_mtime_ns, st.st_size, rules, ext_map)
+    return rules, ext_map
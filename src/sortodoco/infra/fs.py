@@ -1,5 +1,47 @@
 from pathlib import Path
 from typing import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_MKDIR_WORKERS = 8
+
+def _mkdir(path: Path) -> OSError | None:
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        return e
+    return None
+
+def ensure_dirs(dirs: Iterable[Path]) -> dict[Path, OSError]:
+    """
+    Creates every directory (parents included) and returns {dir: error} for
+    those that failed. The mkdir calls run on a small thread pool (exist_ok
+    absorbs races on shared parents), so slow or network drives pay roughly
+    one round-trip instead of one per directory.
+    """
+    dirs = list(dirs)
+    if not dirs:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(MAX_MKDIR_WORKERS, len(dirs))) as ex:
+        errors = list(ex.map(_mkdir, dirs))
+
+    return {d: e for d, e in zip(dirs, errors) if e is not None}
+
+def session_dirs(downloads_dir: Path,
+                 categories: Iterable[str],
+                 session_ts: str) -> dict[str, Path]:
+    """
+    Returns mapping {category: session_dir}, always including _Misc.
+    Nothing is created on disk.
+    """
+    mapping: dict[str, Path] = {
+        category: downloads_dir / category / session_ts for category in categories
+    }
+
+    if "_Misc" not in mapping:
+        mapping["_Misc"] = downloads_dir / "_Misc" / session_ts
+
+    return mapping
 
 def ensure_session_dirs(downloads_dir: Path,
                         categories: Iterable[str],
@@ -8,16 +50,10 @@ def ensure_session_dirs(downloads_dir: Path,
     Returns mapping {category: session_dir} and ensures they exist.
     Also ensures _Misc/session_ts exists.
     """
-    mapping: dict[str, Path] = {}
-    
-    for category in categories:
-        session_dir: Path = downloads_dir / category / session_ts
-        session_dir.mkdir(parents=True, exist_ok=True)
-        mapping[category] = session_dir
-    
-    if "_Misc" not in mapping:
-        misc_dir = downloads_dir / "_Misc" / session_ts
-        misc_dir.mkdir(parents=True, exist_ok=True)
-        mapping["_Misc"] = misc_dir
+    mapping = session_dirs(downloads_dir, categories, session_ts)
+
+    failed = ensure_dirs(mapping.values())
+    if failed:
+        raise next(iter(failed.values()))
 
-    return mapping
\ No newline at end of file
+    return mapping
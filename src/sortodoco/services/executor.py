@@ -1,56 +1,155 @@
 from pathlib import Path
 import shutil
 import os
+import errno
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from sortodoco.domain.models import Plan, Operation
+from sortodoco.infra.fs import ensure_dirs
 
-def unique_target(dst: Path) -> Path:
+TargetCounters = dict[tuple[str, str, str], int]
+
+def unique_target(dst: Path, counters: TargetCounters | None = None) -> Path:
     """
-    Rename-with-suffix. If destiation exists, try renaming with 
+    Rename-with-suffix. Reserves dst, or if taken
     "name (1).txt, name (2).txt, ..."
-    Stops when a non-existing path found.
+    The reservation is an empty 0o600 file created with O_CREAT | O_EXCL, so no
+    two callers can get the same path; the caller replaces it or removes it.
+    counters remembers the next free index per (parent, stem, suffix), so
+    repeated conflicts in one run don't probe (1), (2), ... from the start.
     """
-    if not dst.exists():
-        return dst
-    
     parent = dst.parent
     stem = dst.stem
     suffix = dst.suffix
 
-    i = 1
+    key = (str(parent), stem, suffix)
+    i = counters.get(key, 0) if counters is not None else 0
     while True:
-        candidate = parent / f"{stem} ({i}){suffix}"
+        candidate = dst if i == 0 else parent / f"{stem} ({i}){suffix}"
+
+        try:
+            fd = os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        except FileExistsError:
+            i += 1
+            continue
 
-        if not candidate.exists():
-            return candidate
-        
-        i += 1
+        os.close(fd)
+        if counters is not None:
+            counters[key] = i + 1
+        return candidate
+
+
+def _replace_into(src: Path, target: Path) -> None:
+    """
+    Moves src over the reserved target. os.replace overwrites atomically on
+    POSIX and Windows; only cross-device moves (EXDEV) fall back to copying
+    into a temp file next to target and swapping it in.
+    """
+    try:
+        os.replace(src, target)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".", suffix=".part")
+    os.close(fd)
+    try:
+        if os.path.islink(src):
+            os.unlink(tmp)
+            os.symlink(os.readlink(src), tmp)
+        else:
+            shutil.copy2(src, tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        if os.path.lexists(tmp):
+            os.unlink(tmp)
+        raise
+    os.unlink(src)
+
+
+MAX_MOVE_WORKERS = 8
+
+def _move_one(op: Operation, counters: TargetCounters) -> tuple[str, str | None]:
+    """
+    Moves a single op, returns ("moved" | "skipped" | "error", reason).
+    """
+    if op.kind != "move":
+        return ("skipped", None)
+
+    try:
+        # op.dst.parent was created by apply_plan before the moves
+        target = unique_target(op.dst, counters)
+
+        try:
+            # Replaces the empty placeholder left by unique_target
+            _replace_into(op.src, target)
+        except BaseException:
+            target.unlink(missing_ok=True)
+            raise
+        return ("moved", None)
+    except Exception as e:
+        return _error_result(e)
+
+def _error_result(e: Exception) -> tuple[str, str]:
+    if isinstance(e, PermissionError):
+        return ("error", f"permission: {e}")
+    if isinstance(e, FileNotFoundError):
+        return ("error", f"notfound: {e}")
+    return ("error", f"error: {e}")
+
+def _move_group(ops: list[Operation], counters: TargetCounters) -> list[tuple[str, str | None]]:
+    return [_move_one(op, counters) for op in ops]
 
 
 def apply_plan(plan: Plan) -> dict:
     """
     Performs all Ops and and reports every action:
     {"moved": N, "skipped": M, errors: [(src, reason), ...]}
+
+    Ops are grouped by destination directory. All destination directories are
+    created up front in parallel (infra.fs.ensure_dirs); then each group runs
+    serially (one writer per directory and per counters key), groups in parallel.
     """
 
     report = {"moved": 0, "skipped": 0, "errors": []}
-    for op in plan.ops:
-        if op.kind != "move":
-            report["skipped"] += 1
-            continue
 
-        try:
-            target = unique_target(op.dst)
-            target.parent.mkdir(parents=True, exist_ok=True)
-            
-            shutil.move(str(op.src), str(target))
+    groups: dict[Path, list[int]] = {}
+    for i, op in enumerate(plan.ops):
+        groups.setdefault(op.dst.parent, []).append(i)
+
+    results: list[tuple[str, str | None]] = [("skipped", None)] * len(plan.ops)
+
+    # A directory that can't be created fails all of its ops
+    failed = ensure_dirs(
+        d for d, idxs in groups.items() if any(plan.ops[i].kind == "move" for i in idxs)
+    )
+    for d, e in failed.items():
+        for i in groups.pop(d):
+            if plan.ops[i].kind == "move":
+                results[i] = _error_result(e)
+
+    # Shared safely: keys are per directory and each directory has one worker
+    counters: TargetCounters = {}
+    if groups:
+        with ThreadPoolExecutor(max_workers=min(MAX_MOVE_WORKERS, len(groups))) as ex:
+            futures = {
+                ex.submit(_move_group, [plan.ops[i] for i in idxs], counters): idxs
+                for idxs in groups.values()
+            }
+            for future in as_completed(futures):
+                for i, result in zip(futures[future], future.result()):
+                    results[i] = result
+
+    # Aggregate in plan order so the report is deterministic
+    for op, (status, reason) in zip(plan.ops, results):
+        if status == "moved":
             report["moved"] += 1
-        except PermissionError as e:
-            report["errors"].append((str(op.src), f"permission: {e}"))
-        except FileNotFoundError as e:
-            report["errors"].append((str(op.src), f"notfound: {e}"))
-        except Exception as e:
-            report["errors"].append((str(op.src), f"error: {e}"))
+        elif status == "skipped":
+            report["skipped"] += 1
+        else:
+            report["errors"].append((str(op.src), reason))
 
         # TODO: report for conflicts (useful for GUI-feedback)
-        
+
     return report
\ No newline at end of file
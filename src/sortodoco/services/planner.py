@@ -1,28 +1,40 @@
 from pathlib import Path
-from datetime import datetime
+import os
+import time
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from typing import Iterable, Set
 from sortodoco.domain.models import Plan, Operation
-from sortodoco.infra.config import load_rules, build_ext_map
-from sortodoco.infra.fs import ensure_session_dirs
+from sortodoco.domain.ignore_rules import IgnoreRules
+from sortodoco.infra.config import BUILTIN_IGNORE, load_rules_cached
+from sortodoco.infra.fs import session_dirs
 from sortodoco.utils.filters import is_ignorable
 
-IGNORE_SUFFIXES = (".crdownload", ".part", ".tmp", ".download")
 CATEGORY_NAMES = ("Images", "Videos", "Audios", "Documents", "Executables", "Archives", "Fonts", "Code")
 
-# effective = load_ignore_rules(found_path)
+def plan_downloads(downloads_dir: Path,
+                   rules_path: Path | None,
+                   ignore_rules: IgnoreRules | None = None,
+                   sort_ops: bool = False) -> Plan:
+    """
+    rules_path=None skips loading the rules file; every file is planned into _Misc.
+    ignore_rules defaults to the builtin rules (incomplete downloads, OS junk, hidden files).
+    Ops come in directory order; sort_ops=True orders them by file name (casefolded).
+    """
+    if ignore_rules is None:
+        ignore_rules = BUILTIN_IGNORE
 
-# skip, reasons = is_ignorable(path, effective)
-
-def plan_downloads(downloads_dir: Path, rules_path: Path) -> Plan:
-    session_ts = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    rules = load_rules(rules_path) # {"Images": ["jpg", ...], ...}
-    ext_to_cat = build_ext_map(rules) # {"jpg": "Images", ...}
+    session_ts = time.strftime("%Y-%m-%d_%H-%M-%S")
+    if rules_path is not None:
+        # rules: {"Images": ["jpg", ...], ...}, ext_to_cat: {"jpg": "Images", ...}
+        rules, ext_to_cat = load_rules_cached(rules_path)
+    else:
+        rules, ext_to_cat = {}, {}
 
     cats = [cat for cat in CATEGORY_NAMES if cat in rules] + ["_Misc"]
 
-    target_dirs = ensure_session_dirs(
+    # Planning never touches the disk; the executor creates dirs as it moves
+    target_dirs = session_dirs(
         downloads_dir,
         cats,
         session_ts
@@ -31,24 +43,39 @@ def plan_downloads(downloads_dir: Path, rules_path: Path) -> Plan:
     ops: list[Operation] = []
     summary: dict[str, int] = {cat: 0 for cat in target_dirs.keys()}
 
-    for entry in sorted(downloads_dir.iterdir(), key=lambda p: p.name.lower()):
-        # Guards
-        if entry.is_dir(): # Skip every Directory (even Category-dirs)
+    # scandir's DirEntry caches the file type from the directory read
+    with os.scandir(downloads_dir) as it:
+        entries = list(it)
+
+    # Hot loop: bind lookups to locals once
+    _ops_append = ops.append
+    _get_cat = ext_to_cat.get
+    # Plain string prefixes per category; joining strings is cheaper than Path "/"
+    _targets = {cat: str(d) + os.sep for cat, d in target_dirs.items()}
+    _Op = Operation
+
+    for entry in entries:
+        # Guards (answered from the readdir type; only symlinks need a stat)
+        if entry.is_dir(follow_symlinks=False): # Skip every Directory (even Category-dirs)
             continue
-        if not entry.is_file(): # Guardline
+        if not entry.is_file(): # Regular files and links to them only (no FIFOs, sockets, devices)
             continue
 
-        name_lower = entry.name.lower()
-        # Skipping uncomplete Downloads
-        if name_lower.endswith(IGNORE_SUFFIXES):
+        # Skipping uncomplete Downloads, OS junk, hidden files
+        skip, _reasons = is_ignorable(entry, ignore_rules)
+        if skip:
             continue
 
-        ext = entry.suffix.lower().lstrip(".")
-        category = ext_to_cat.get(ext, "_Misc")
-        dst_dir = target_dirs[category]
-        dst_path = dst_dir / entry.name
-
-        ops.append(Operation(kind="move", src=entry, dst=dst_path))
+        name = entry.name
+        # Same as Path.suffix: a leading dot (".bashrc") is not an extension.
+        # ext_to_cat keys are already lowercase without the dot (see load_rules).
+        dot = name.rfind(".")
+        ext = name[dot + 1:].lower() if dot > 0 else ""
+        category = _get_cat(ext, "_Misc")
+        _ops_append(_Op("move", Path(entry.path), Path(_targets[category] + name)))
         summary[category] += 1
 
+    if sort_ops:
+        ops.sort(key=lambda op: op.src.name.casefold())
+
     return Plan(session_ts=session_ts, ops=ops, summary=summary)
\ No newline at end of file
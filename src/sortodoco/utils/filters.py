@@ -1,20 +1,30 @@
-from pathlib import Path
-from typing import Set
+from typing import Protocol, Set
 from sortodoco.domain.ignore_rules import IgnoreRules, SkipReason
-import fnmatch, os
 
-def is_ignorable(path: Path, rules: IgnoreRules) -> tuple[bool, Set[SkipReason]]:
+class NamedEntry(Protocol):
+    """Anything with a file name: pathlib.Path or os.DirEntry."""
+    @property
+    def name(self) -> str: ...
+
+def is_ignorable(path: NamedEntry, rules: IgnoreRules) -> tuple[bool, Set[SkipReason]]:
+    """
+    Checks path.name against the rules. Rules are expected to be casefolded
+    (the *_cf fields).
+    """
     reasons: set[SkipReason] = set()
     name_cf = path.name.casefold()
 
-    # TODO: NAME exact
-    # TODO: SUFFIX on complete name (endswith(tuple))
-    # TODO: GLOB (fnmatch.fnmatchcase(name_cf, pat))
-    # TODO: HIDDEN_ATTR (if rules.hidden then True)
+    if name_cf in rules.names_cf:
+        reasons.add(SkipReason.NAME)
+    if rules.suffixes_cf and name_cf.endswith(rules.suffixes_cf):
+        reasons.add(SkipReason.SUFFIX)
+    if rules.matches_glob(name_cf):
+        reasons.add(SkipReason.GLOB)
+    if rules.hidden and _has_hidden_attr(path):
+        reasons.add(SkipReason.HIDDEN_ATTR)
 
     return (len(reasons) > 0, reasons)
 
-def _has_hidden_attr(path: Path) -> bool:
-    # TODO: Unix: leading point
+def _has_hidden_attr(path: NamedEntry) -> bool:
     # TODO: Windows: real hidden-attributes (future)
-    pass
\ No newline at end of file
+    return path.name.startswith(".")
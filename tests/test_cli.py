@@ -0,0 +1,49 @@
+import subprocess
+import sys
+from pathlib import Path
+
+def test_version_does_not_import_typer():
+    code = (
+        "import sys; from sortodoco.cli.main import main; main(['version']); "
+        "assert 'typer' not in sys.modules and 'rich' not in sys.modules"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.startswith("sortodoco ")
+
+def test_plan_dry_leaves_folder_untouched(tmp_path):
+    from typer.testing import CliRunner
+    from sortodoco.cli.app import build_app
+
+    (tmp_path / "a.pdf").write_bytes(b"x")
+    runner = CliRunner()
+
+    result = runner.invoke(build_app(), ["plan", str(tmp_path), "--dry"])
+    assert result.exit_code == 0, result.output
+    assert [p.name for p in tmp_path.iterdir()] == ["a.pdf"]
+
+    result = runner.invoke(build_app(), ["plan", str(tmp_path), "--no-rules"])
+    assert result.exit_code == 2
+
+def test_plan_json_output_parses(tmp_path):
+    import json
+    from typer.testing import CliRunner
+    from sortodoco.cli.app import build_app
+
+    for name in ["a.pdf", "b.zz"]:
+        (tmp_path / name).write_bytes(b"x")
+    runner = CliRunner()
+
+    result = runner.invoke(build_app(), ["plan", str(tmp_path), "--dry", "--format", "json"])
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.stdout)
+    assert set(data) == {"session", "summary", "ops"}
+    assert data["summary"]["Documents"] == 1 and data["summary"]["_Misc"] == 1
+    assert sorted(op["src"] for op in data["ops"]) == [str(tmp_path / "a.pdf"), str(tmp_path / "b.zz")]
+
+    result = runner.invoke(build_app(), ["plan", str(tmp_path), "--format", "json"])
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.stdout)
+    assert data["report"] == {"moved": 2, "skipped": 0, "errors": []}
+    assert all(Path(op["dst"]).is_file() for op in data["ops"])
@@ -0,0 +1,41 @@
+import json
+import os
+from pathlib import Path
+from sortodoco.infra import config as config_module
+from sortodoco.infra.config import load_rules_cached, load_ignore_rules
+
+def test_load_rules_cached_reuses_until_file_changes(tmp_path: Path):
+    rules_path = tmp_path / "extensions.json"
+    rules_path.write_text('{"Images": [".JPG"]}')
+
+    rules, ext_map = load_rules_cached(rules_path)
+    assert ext_map == {"jpg": "Images"}
+    assert load_rules_cached(rules_path)[1] is ext_map
+
+    rules_path.write_text('{"Documents": ["pdf", "txt"]}')
+    st = rules_path.stat()
+    os.utime(rules_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert load_rules_cached(rules_path)[1] == {"pdf": "Documents", "txt": "Documents"}
+
+def test_load_ignore_rules_merges_valid_user_rules(tmp_path: Path):
+    config = tmp_path / "ignore.json"
+    config.write_text('{"suffixes": [".LOG"], "names": ["Notes.txt"], "hidden": false}')
+
+    rules = load_ignore_rules(config)
+
+    assert ".log" in rules.suffixes_cf and ".part" in rules.suffixes_cf
+    assert "notes.txt" in rules.names_cf
+    assert rules.hidden is False
+
+def test_load_ignore_rules_falls_back_on_invalid_input(tmp_path: Path, monkeypatch):
+    config = tmp_path / "ignore.json"
+    for bad in ['{"suffixes": ".log"}', '{"names": [1]}', '{"hidden": "false"}', '[]', '{']:
+        config.write_text(bad)
+        assert load_ignore_rules(config) == load_ignore_rules(None)
+
+    # Latin-1 bytes are not valid UTF-8, with orjson and with the stdlib fallback
+    config.write_bytes('{"names": ["caf\u00e9"]}'.encode("latin-1"))
+    assert load_ignore_rules(config) == load_ignore_rules(None)
+    monkeypatch.setattr(config_module, "_json_loads", json.loads)
+    assert load_ignore_rules(config) == load_ignore_rules(None)
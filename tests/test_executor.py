@@ -0,0 +1,83 @@
+import os
+from pathlib import Path
+from sortodoco.domain.models import Plan, Operation
+from sortodoco.services.executor import apply_plan, unique_target
+
+def test_apply_plan_moves_and_renames_on_conflict(tmp_path: Path):
+    src_dir = tmp_path / "src"
+    dst_dir = tmp_path / "dst"
+    src_dir.mkdir()
+    dst_dir.mkdir()
+    (dst_dir / "a.txt").write_text("existing")
+    for name in ["a.txt", "b.txt"]:
+        (src_dir / name).write_text(name)
+
+    ops = [Operation("move", src_dir / n, dst_dir / n) for n in ["a.txt", "b.txt", "gone.txt"]]
+    report = apply_plan(Plan(session_ts="ts", ops=ops, summary={}))
+
+    assert report["moved"] == 2
+    assert [src for src, _ in report["errors"]] == [str(src_dir / "gone.txt")]
+    assert (dst_dir / "a.txt").read_text() == "existing"
+    assert (dst_dir / "a (1).txt").read_text() == "a.txt"
+    assert (dst_dir / "b.txt").read_text() == "b.txt"
+
+def test_unique_target_counters_and_reservation(tmp_path: Path):
+    (tmp_path / "a.txt").write_text("existing")
+    counters = {}
+
+    first = unique_target(tmp_path / "a.txt", counters)
+    second = unique_target(tmp_path / "a.txt", counters)
+
+    assert (first.name, second.name) == ("a (1).txt", "a (2).txt")
+    assert counters[(str(tmp_path), "a", ".txt")] == 3
+    assert first.stat().st_size == 0
+    assert first.stat().st_mode & 0o777 == 0o600
+
+def test_apply_plan_removes_placeholder_on_failure(tmp_path: Path):
+    dst = tmp_path / "dst" / "gone.txt"
+    ops = [Operation("move", tmp_path / "gone.txt", dst)]
+
+    report = apply_plan(Plan(session_ts="ts", ops=ops, summary={}))
+
+    assert report["errors"][0][1].startswith("notfound")
+    assert list(dst.parent.iterdir()) == []
+
+def test_apply_plan_moves_symlinks(tmp_path: Path):
+    (tmp_path / "real.txt").write_text("x")
+    link = tmp_path / "link.txt"
+    link.symlink_to(tmp_path / "real.txt")
+    dst = tmp_path / "dst" / "link.txt"
+
+    report = apply_plan(Plan(session_ts="ts", ops=[Operation("move", link, dst)], summary={}))
+
+    assert report["moved"] == 1
+    assert dst.is_symlink() and not os.path.lexists(link)
+
+def test_apply_plan_creates_destination_dirs(tmp_path: Path):
+    for name in ["a.txt", "b.pdf"]:
+        (tmp_path / name).write_text(name)
+    blocker = tmp_path / "blocker"
+    blocker.write_text("not a dir")
+    ops = [
+        Operation("move", tmp_path / "a.txt", tmp_path / "Documents" / "ts" / "a.txt"),
+        Operation("move", tmp_path / "b.pdf", tmp_path / "Other" / "ts" / "b.pdf"),
+        Operation("move", tmp_path / "b.pdf", blocker / "ts" / "b.pdf"),
+    ]
+
+    report = apply_plan(Plan(session_ts="ts", ops=ops, summary={}))
+
+    assert report["moved"] == 2
+    assert (tmp_path / "Documents" / "ts" / "a.txt").is_file()
+    assert (tmp_path / "Other" / "ts" / "b.pdf").is_file()
+    assert report["errors"][0][0] == str(tmp_path / "b.pdf")
+
+def test_ensure_dirs_reports_failures(tmp_path: Path):
+    from sortodoco.infra.fs import ensure_dirs
+
+    (tmp_path / "file").write_text("x")
+    dirs = [tmp_path / "a" / "b", tmp_path / "c", tmp_path / "file" / "d"]
+
+    failed = ensure_dirs(dirs)
+
+    assert (tmp_path / "a" / "b").is_dir() and (tmp_path / "c").is_dir()
+    assert list(failed) == [tmp_path / "file" / "d"]
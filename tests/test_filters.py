@@ -0,0 +1,25 @@
+from pathlib import Path
+from sortodoco.domain.ignore_rules import IgnoreRules, SkipReason
+from sortodoco.utils.filters import is_ignorable
+
+RULES = IgnoreRules(
+    suffixes_cf=(".part", ".tmp"),
+    names_cf=frozenset({"thumbs.db"}),
+    globs_cf=("~$*", "desktop.ini"),
+    hidden=True,
+)
+
+def test_is_ignorable_reasons():
+    assert is_ignorable(Path("Thumbs.DB"), RULES) == (True, {SkipReason.NAME})
+    assert is_ignorable(Path("movie.mkv.PART"), RULES) == (True, {SkipReason.SUFFIX})
+    assert is_ignorable(Path("~$report.docx"), RULES) == (True, {SkipReason.GLOB})
+    assert is_ignorable(Path("Desktop.ini"), RULES) == (True, {SkipReason.GLOB})
+    assert is_ignorable(Path(".hidden"), RULES) == (True, {SkipReason.HIDDEN_ATTR})
+    assert is_ignorable(Path("report.docx"), RULES) == (False, set())
+
+def test_matches_glob_literals_and_patterns():
+    assert RULES.matches_glob("desktop.ini")
+    assert RULES.matches_glob("~$x.docx")
+    assert not RULES.matches_glob("x~$")
+    assert not RULES.matches_glob("desktop.ini.bak")
+    assert not IgnoreRules().matches_glob("anything")
@@ -0,0 +1,54 @@
+from pathlib import Path
+import pytest
+from sortodoco.cli import paths
+from sortodoco.cli.paths import resolve_folder, resolve_rules_path
+
+@pytest.fixture(autouse=True)
+def _fresh_caches(monkeypatch):
+    monkeypatch.setattr(paths, "_folder_cache", {})
+    monkeypatch.setattr(paths, "_rules_path_cache", None)
+
+def test_resolve_folder_only_resolves_relative_paths_and_symlinks(tmp_path: Path, monkeypatch):
+    target = tmp_path / "real"
+    target.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(target)
+    unresolved = tmp_path / "real" / ".." / "real"
+
+    assert resolve_folder(str(unresolved)) == unresolved
+    assert resolve_folder(str(link)) == target.resolve()
+
+    monkeypatch.chdir(tmp_path)
+    assert resolve_folder("real") == target.resolve()
+
+def test_resolve_folder_memoizes_absolute_paths(tmp_path: Path):
+    first = resolve_folder(str(tmp_path))
+    assert resolve_folder(str(tmp_path)) is first
+
+def test_resolve_folder_follows_cwd_for_relative_paths(tmp_path: Path, monkeypatch):
+    for name in ["a", "b"]:
+        (tmp_path / name / "sub").mkdir(parents=True)
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert resolve_folder("sub") == (tmp_path / "a" / "sub").resolve()
+    monkeypatch.chdir(tmp_path / "b")
+    assert resolve_folder("sub") == (tmp_path / "b" / "sub").resolve()
+
+def test_resolve_rules_path_caches_bundled_fallback(tmp_path: Path, monkeypatch):
+    first = tmp_path / "first.json"
+    second = tmp_path / "second.json"
+    first.write_text("{}")
+    second.write_text("{}")
+
+    monkeypatch.setattr(paths, "BUNDLED_RULES", first)
+    assert resolve_rules_path() == first
+
+    # cached until the cached file disappears
+    monkeypatch.setattr(paths, "BUNDLED_RULES", second)
+    assert resolve_rules_path() == first
+    first.unlink()
+    assert resolve_rules_path() == second
+
+    second.unlink()
+    assert resolve_rules_path() is None
+    assert resolve_rules_path(str(tmp_path / "missing.json")) is None
@@ -0,0 +1,40 @@
+from pathlib import Path
+from sortodoco.services.planner import plan_downloads
+
+RULES = Path("rules/extensions.json")
+
+def _planned(plan) -> dict[str, str]:
+    return {op.src.name: op.dst.parent.parent.name for op in plan.ops}
+
+def test_plan_skips_ignored_files(tmp_path: Path):
+    for name in ["movie.mp4.part", "Thumbs.db", "desktop.ini", "~$report.docx", ".hidden", "keep.pdf"]:
+        (tmp_path / name).write_bytes(b"x")
+
+    assert _planned(plan_downloads(tmp_path, RULES)) == {"keep.pdf": "Documents"}
+
+def test_plan_extension_from_last_dot(tmp_path: Path):
+    for name in ["file.", "a.TAR.GZ", "noext", "pic.JPG"]:
+        (tmp_path / name).write_bytes(b"x")
+
+    assert _planned(plan_downloads(tmp_path, RULES)) == {
+        "file.": "_Misc",
+        "a.TAR.GZ": "Archives",
+        "noext": "_Misc",
+        "pic.JPG": "Images",
+    }
+
+def test_plan_leading_dot_is_not_an_extension(tmp_path: Path):
+    from sortodoco.domain.ignore_rules import IgnoreRules
+
+    (tmp_path / ".py").write_bytes(b"x")
+    plan = plan_downloads(tmp_path, RULES, ignore_rules=IgnoreRules(hidden=False))
+
+    assert _planned(plan) == {".py": "_Misc"}
+
+def test_plan_sort_ops(tmp_path: Path):
+    for name in ["b.txt", "C.txt", "a.txt"]:
+        (tmp_path / name).write_bytes(b"x")
+
+    plan = plan_downloads(tmp_path, RULES, sort_ops=True)
+
+    assert [op.src.name for op in plan.ops] == ["a.txt", "b.txt", "C.txt"]